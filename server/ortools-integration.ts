@@ -1,4 +1,4 @@
-import { spawn } from 'child_process';
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
 import path from 'path';
 import { storage } from './storage';
 
@@ -15,6 +15,8 @@ export interface ORToolsRoute {
 export interface ORToolsInput {
   drivers: ORToolsDriver[];
   routes: ORToolsRoute[];
+  // Solve the CP-SAT integer program instead of the assignment solver
+  use_mip?: boolean;
 }
 
 export interface ORToolsAssignment {
@@ -45,53 +47,123 @@ export interface ORToolsResult {
   message?: string;
 }
 
+interface PendingRequest {
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+  timeout: NodeJS.Timeout;
+}
+
+interface ORToolsService {
+  process: ChildProcessWithoutNullStreams;
+  // Requests written to this process, in the order their responses will arrive
+  pending: PendingRequest[];
+}
+
+// How long a single request may take before the service is restarted
+const REQUEST_TIMEOUT_MS = 60_000;
+
+// Only the tail of the service's stderr is kept for error messages
+const MAX_STDERR_LENGTH = 4096;
+
+let currentService: ORToolsService | null = null;
+
 /**
- * Execute OR Tools Python script
+ * Reject a service's outstanding requests so the next call starts a fresh
+ * process. A process can report several failures (e.g. 'error' then 'close');
+ * only the first one has anything left to reject, and requests already sent to
+ * a replacement process are never touched.
  */
-async function executeORTools(operation: string, input?: any): Promise<any> {
+function failService(service: ORToolsService, error: Error): void {
+  if (currentService === service) {
+    currentService = null;
+  }
+  const requests = service.pending;
+  service.pending = [];
+  requests.forEach(request => {
+    clearTimeout(request.timeout);
+    request.reject(error);
+  });
+}
+
+/**
+ * Start the long-running OR Tools Python service, or return the running one.
+ * Requests and responses are newline-delimited JSON and are answered in order.
+ */
+function getORToolsService(): ORToolsService {
+  if (currentService) {
+    return currentService;
+  }
+
   const pythonScript = path.join(process.cwd(), 'server', 'ortools-service.py');
-  
-  return new Promise((resolve, reject) => {
-    const args = operation === 'square' && input !== undefined 
-      ? [pythonScript, operation, input.toString()]
-      : [pythonScript, operation];
-    
-    const pythonProcess = spawn('python3', args);
-    
-    let stdout = '';
-    let stderr = '';
-    
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-    
-    // For operations that need JSON input, send it via stdin
-    if ((operation === 'solve_assignment' || operation === 'validate') && input) {
-      pythonProcess.stdin.write(JSON.stringify(input));
-      pythonProcess.stdin.end();
-    }
-    
-    pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        reject(new Error(`Python process exited with code ${code}. stdout: ${stdout}, stderr: ${stderr}`));
-        return;
+  const pythonProcess = spawn('python3', [pythonScript, 'serve']);
+  const service: ORToolsService = { process: pythonProcess, pending: [] };
+
+  let stdout = '';
+  let stderr = '';
+
+  // Decode as a stream so a multibyte character split across chunks survives
+  pythonProcess.stdout.setEncoding('utf8');
+  pythonProcess.stderr.setEncoding('utf8');
+
+  pythonProcess.stdout.on('data', (data: string) => {
+    stdout += data;
+
+    let newlineIndex;
+    while ((newlineIndex = stdout.indexOf('\n')) !== -1) {
+      const line = stdout.slice(0, newlineIndex).trim();
+      stdout = stdout.slice(newlineIndex + 1);
+
+      const request = service.pending.shift();
+      if (!request) {
+        continue;
       }
-      
+      clearTimeout(request.timeout);
+
       try {
-        const result = JSON.parse(stdout.trim());
-        resolve(result);
+        request.resolve(JSON.parse(line));
       } catch (error) {
-        reject(new Error(`Failed to parse JSON output: ${stdout}. Error: ${error}`));
+        request.reject(new Error(`Failed to parse JSON output: ${line}. Error: ${error}`));
       }
-    });
-    
-    pythonProcess.on('error', (error) => {
-      reject(new Error(`Failed to start Python process: ${error.message}`));
-    });
+    }
+  });
+
+  pythonProcess.stderr.on('data', (data: string) => {
+    stderr = (stderr + data).slice(-MAX_STDERR_LENGTH);
+  });
+
+  pythonProcess.on('close', (code) => {
+    failService(service, new Error(`Python process exited with code ${code}. stderr: ${stderr}`));
+  });
+
+  pythonProcess.on('error', (error) => {
+    failService(service, new Error(`Failed to start Python process: ${error.message}`));
+  });
+
+  // Writes can fail with EPIPE while the process is exiting
+  pythonProcess.stdin.on('error', (error) => {
+    failService(service, new Error(`Failed to write to Python process: ${error.message}`));
+  });
+
+  currentService = service;
+  return service;
+}
+
+/**
+ * Execute an OR Tools operation on the Python service
+ */
+async function executeORTools(operation: string, input?: any): Promise<any> {
+  const service = getORToolsService();
+
+  return new Promise((resolve, reject) => {
+    // Requests are answered in order, so a hung request would block every
+    // one queued behind it; restart the service instead
+    const timeout = setTimeout(() => {
+      failService(service, new Error(`OR Tools request timed out after ${REQUEST_TIMEOUT_MS / 1000}s`));
+      service.process.kill('SIGKILL');
+    }, REQUEST_TIMEOUT_MS);
+
+    service.pending.push({ resolve, reject, timeout });
+    service.process.stdin.write(JSON.stringify({ operation, input }) + '\n');
   });
 }
 
@@ -1,5 +1,18 @@
-from ortools.linear_solver import pywraplp
 import json
+import sys
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+# CP-SAT only accepts integer objective coefficients, so driver weights
+# (fractions of the total remaining hours) are scaled by this factor
+_OBJECTIVE_SCALE = 1_000_000
+
+# Parallel search workers used by CP-SAT
+_NUM_SEARCH_WORKERS = 4
 
 
 def square_number(number):
@@ -7,22 +20,32 @@ def square_number(number):
     Calculate the square of a number.
 
     Args:
-        number (int or float): The number to square
+        number (float): The number to square
 
     Returns:
-        int or float: The squared result
+        float: The squared result
     """
     return number**2
 
 
-def solve_driver_assignment(data):
+def solve_driver_assignment(data, use_mip=False):
     """
-    Solve driver assignment problem for a single day using OR-Tools.
+    Solve driver assignment problem for a single day.
     Assigns daily routes to drivers while considering their remaining monthly hours
     for even distribution across the month.
 
+    When pairing the longest routes with the drivers who have the most hours
+    left covers every route, that pairing is optimal and returned directly.
+    Otherwise, with at most one route per driver this is a linear assignment
+    problem, so it is solved with the Hungarian algorithm by default.
+    Setting use_mip solves the same model as an integer program with
+    OR-Tools CP-SAT instead.
+
     Args:
-        data (dict): Contains drivers (with monthly available hours) and routes (daily)
+        data (dict): Contains drivers (with monthly available hours) and routes
+            (daily), and optionally 'use_mip' to select CP-SAT
+        use_mip (bool): Solve with OR-Tools CP-SAT instead of sorting and
+            the assignment solver
 
     Returns:
         dict: Assignment results with route-driver mapping for the day
@@ -33,128 +56,213 @@ def solve_driver_assignment(data):
     if not drivers or not routes:
         raise ValueError("Both drivers and routes must be provided")
 
-    # Create the solver
-    solver = pywraplp.Solver.CreateSolver('SCIP')
-    if not solver:
-        raise RuntimeError("SCIP solver unavailable")
+    driver_hours, route_hours, weights = _pack_hours(drivers, routes)
+
+    if use_mip or data.get('use_mip'):
+        return _solve_with_cp_sat(drivers, routes,
+                                  _feasible_pairs(driver_hours, route_hours),
+                                  weights)
+
+    # The objective only depends on which drivers work, so when sorting can
+    # cover every route the optimum is found without building a model
+    if (len(routes) <= len(drivers)
+            and route_hours.max() <= driver_hours.max()):
+        pairs = _assign_by_sorting(driver_hours, route_hours)
+        if pairs is not None:
+            return _build_result(drivers, routes, pairs,
+                                 float(sum(weights[i] for i, _ in pairs)))
+
+    return _solve_with_assignment(drivers, routes,
+                                  _feasible_pairs(driver_hours, route_hours),
+                                  weights)
+
+
+def _pack_hours(drivers, routes):
+    """
+    Pack driver and route hours into arrays and compute the objective weights.
+
+    Args:
+        drivers (list): List of driver dictionaries
+        routes (list): List of route dictionaries
+
+    Returns:
+        tuple: (driver_hours, route_hours, weights) as float64 arrays
+    """
+    # Pack hours into arrays once instead of looking them up per (i, j) pair
+    driver_hours = np.fromiter((d['available_hours'] for d in drivers),
+                               dtype=np.float64,
+                               count=len(drivers))
+    route_hours = np.fromiter((r['hours'] for r in routes),
+                              dtype=np.float64,
+                              count=len(routes))
+
+    # Calculate total remaining hours for normalization
+    total_remaining_hours = float(driver_hours.sum())
+
+    # Weight by remaining hours - drivers with more remaining hours get priority
+    if total_remaining_hours > 0:
+        weights = driver_hours / total_remaining_hours
+    else:
+        weights = np.ones(len(drivers))
+
+    return driver_hours, route_hours, weights
+
+
+def _feasible_pairs(driver_hours, route_hours):
+    """
+    Find which drivers have enough hours left for which routes.
+
+    Args:
+        driver_hours (numpy.ndarray): Remaining hours per driver
+        route_hours (numpy.ndarray): Hours required per route
+
+    Returns:
+        numpy.ndarray: Boolean matrix, True if driver i can take route j
+    """
+    return driver_hours[:, np.newaxis] >= route_hours[np.newaxis, :]
+
+
+def _solve_with_assignment(drivers, routes, feasible, weights):
+    """
+    Solve the driver assignment problem as a linear assignment problem with
+    the Hungarian algorithm.
+
+    Args:
+        drivers (list): List of driver dictionaries
+        routes (list): List of route dictionaries
+        feasible (numpy.ndarray): Boolean matrix, True if driver i can take route j
+        weights (numpy.ndarray): Objective weight per driver
+
+    Returns:
+        dict: Assignment results with route-driver mapping for the day
+    """
+    # Imported here since SciPy takes longer to load than most solves, and the
+    # sorting shortcut usually makes it unnecessary
+    from scipy.optimize import linear_sum_assignment
+
+    # Every route needs its own driver
+    if len(routes) > len(drivers):
+        return _infeasible_result()
+
+    # The cost is the negated weight so that minimizing cost maximizes the
+    # objective; infeasible pairs can never be selected.
+    cost = np.where(feasible, -weights[:, np.newaxis], np.inf)
+
+    try:
+        row_ind, col_ind = linear_sum_assignment(cost)
+    except ValueError:
+        # Raised when no assignment covers every route with finite cost
+        return _infeasible_result()
+
+    return _build_result(drivers, routes, zip(row_ind.tolist(),
+                                              col_ind.tolist()),
+                         float(-cost[row_ind, col_ind].sum()))
+
+
+def _assign_by_sorting(driver_hours, route_hours):
+    """
+    Assign the longest routes to the drivers with the most remaining hours.
+
+    Since a driver's weight grows with their remaining hours, using the drivers
+    with the most hours maximizes the objective, and pairing both sides in
+    descending order covers every route whenever any choice of those drivers
+    can. The result is therefore optimal whenever it is returned.
+
+    Args:
+        driver_hours (numpy.ndarray): Remaining hours per driver
+        route_hours (numpy.ndarray): Hours required per route, no more routes
+            than drivers
+
+    Returns:
+        list or None: (driver index, route index) pairs ordered by driver, or
+            None if some route is longer than the driver paired with it
+    """
+    route_order = np.argsort(-route_hours, kind='stable')
+    driver_order = np.argsort(-driver_hours,
+                              kind='stable')[:len(route_hours)]
+
+    if np.any(driver_hours[driver_order] < route_hours[route_order]):
+        return None
+
+    return sorted(zip(driver_order.tolist(), route_order.tolist()))
+
+
+def _solve_with_cp_sat(drivers, routes, feasible, weights):
+    """
+    Solve the driver assignment problem as a binary integer program with
+    OR-Tools CP-SAT.
+
+    Args:
+        drivers (list): List of driver dictionaries
+        routes (list): List of route dictionaries
+        feasible (numpy.ndarray): Boolean matrix, True if driver i can take route j
+        weights (numpy.ndarray): Objective weight per driver
+
+    Returns:
+        dict: Assignment results with route-driver mapping for the day
+    """
+    # Imported here since CP-SAT takes longer to load than most solves, and
+    # this path only runs when the integer program is requested
+    from ortools.sat.python import cp_model
+
+    model = cp_model.CpModel()
 
     num_drivers = len(drivers)
     num_routes = len(routes)
 
-    # Create binary variables: x[i][j] = 1 if driver i is assigned to route j
-    x = {}
-    for i in range(num_drivers):
-        for j in range(num_routes):
-            x[i, j] = solver.IntVar(0, 1, f'driver_{i}_route_{j}')
+    # Create binary variables: x[i][j] = 1 if driver i is assigned to route j.
+    # Driver's assigned hours can't exceed their remaining monthly hours, and
+    # with at most one route per driver that only rules out pairs where the
+    # route is longer than the driver's remaining hours, so those binaries are
+    # never created. Names are left empty to skip formatting one per variable.
+    feasible_pairs = np.argwhere(feasible).tolist()
+    x = np.empty((num_drivers, num_routes), dtype=object)
+    for i, j in feasible_pairs:
+        x[i, j] = model.NewBoolVar('')
 
     # Constraint 1: Each route is assigned to exactly one driver
     for j in range(num_routes):
-        solver.Add(solver.Sum([x[i, j] for i in range(num_drivers)]) == 1)
+        model.AddExactlyOne(x[feasible[:, j], j].tolist())
 
     # Constraint 2: Each driver can be assigned to at most one route per day
-    for i in range(num_drivers):
-        solver.Add(solver.Sum([x[i, j] for j in range(num_routes)]) <= 1)
+    driver_routes = [x[i, feasible[i]].tolist() for i in range(num_drivers)]
+    for assigned in driver_routes:
+        model.AddAtMostOne(assigned)
 
-    # Constraint 3: Driver's assigned hours don't exceed their remaining monthly hours
-    for i in range(num_drivers):
-        daily_hours = solver.Sum(
-            [x[i, j] * routes[j]['hours'] for j in range(num_routes)])
-        solver.Add(daily_hours <= drivers[i]['available_hours'])
+    # Symmetry breaking: drivers with equal remaining hours are interchangeable,
+    # so within each such group an earlier driver must be used before a later one
+    drivers_by_hours = {}
+    for i, driver in enumerate(drivers):
+        if driver_routes[i]:
+            drivers_by_hours.setdefault(driver['available_hours'], []).append(i)
+    for group in drivers_by_hours.values():
+        for earlier, later in zip(group, group[1:]):
+            model.Add(
+                cp_model.LinearExpr.Sum(driver_routes[earlier]) >=
+                cp_model.LinearExpr.Sum(driver_routes[later]))
 
     # Objective: Prioritize drivers with more remaining hours for even distribution
-    # This helps balance workload across the month
-    objective = solver.Objective()
-
-    # Calculate total remaining hours for normalization
-    total_remaining_hours = sum(driver['available_hours']
-                                for driver in drivers)
-
-    for i in range(num_drivers):
-        for j in range(num_routes):
-            # Weight by remaining hours - drivers with more remaining hours get priority
-            # This ensures even distribution over the month
-            if total_remaining_hours > 0:
-                weight = drivers[i]['available_hours'] / total_remaining_hours
-            else:
-                weight = 1.0
-            objective.SetCoefficient(x[i, j], weight)
-
-    objective.SetMaximization()
+    # This helps balance workload across the month. CP-SAT needs integer
+    # coefficients, so the weights are scaled up and rounded.
+    scaled_weights = np.rint(weights * _OBJECTIVE_SCALE).astype(np.int64).tolist()
+    model.Maximize(
+        cp_model.LinearExpr.WeightedSum(
+            [x[i, j] for i, j in feasible_pairs],
+            [scaled_weights[i] for i, _ in feasible_pairs]))
 
     # Solve the problem
-    status = solver.Solve()
-
-    if status == pywraplp.Solver.OPTIMAL:
-        assignments = []
-        unassigned_routes = []
-        driver_assignments = {}
-
-        # Initialize driver assignments
-        for i in range(num_drivers):
-            driver_assignments[i] = {
-                'name': drivers[i]['name'],
-                'assigned_route': None,
-                'assigned_hours': 0,
-                'remaining_hours': drivers[i]['available_hours']
-            }
-
-        # Process assignments
-        for i in range(num_drivers):
-            for j in range(num_routes):
-                if x[i, j].solution_value() > 0.5:  # Binary variable is 1
-                    assignment = {
-                        'driver_name': drivers[i]['name'],
-                        'route_name': routes[j]['name'],
-                        'route_hours': routes[j]['hours']
-                    }
-                    assignments.append(assignment)
-
-                    # Update driver assignment info
-                    driver_assignments[i]['assigned_route'] = routes[j]['name']
-                    driver_assignments[i]['assigned_hours'] = routes[j][
-                        'hours']
-                    driver_assignments[i]['remaining_hours'] = (
-                        drivers[i]['available_hours'] - routes[j]['hours'])
-
-        # Find unassigned routes
-        assigned_routes = {
-            assignment['route_name']
-            for assignment in assignments
-        }
-        for route in routes:
-            if route['name'] not in assigned_routes:
-                unassigned_routes.append(route['name'])
-
-        # Calculate statistics
-        total_assigned_hours = sum(assignment['route_hours']
-                                   for assignment in assignments)
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = _NUM_SEARCH_WORKERS
+    status = solver.Solve(model)
 
-        return {
-            'status': 'optimal',
-            'assignments': assignments,
-            'driver_status': list(driver_assignments.values()),
-            'unassigned_routes': unassigned_routes,
-            'statistics': {
-                'total_routes': len(routes),
-                'routes_assigned': len(assignments),
-                'routes_unassigned': len(unassigned_routes),
-                'total_hours_assigned': total_assigned_hours,
-                'drivers_working': len(assignments),
-                'drivers_available': num_drivers
-            },
-            'objective_value': solver.Objective().Value()
-        }
+    if status == cp_model.OPTIMAL:
+        pairs = [(i, j) for i, j in feasible_pairs if solver.Value(x[i, j])]
+        # Report the objective with the unscaled weights
+        return _build_result(drivers, routes, pairs,
+                             float(sum(weights[i] for i, _ in pairs)))
 
-    elif status == pywraplp.Solver.INFEASIBLE:
-        return {
-            'status':
-            'infeasible',
-            'message':
-            'No feasible solution found. Possible reasons:\n'
-            '1. Total route hours exceed total available driver hours\n'
-            '2. Individual driver remaining hours are insufficient\n'
-            '3. More routes than available drivers'
-        }
+    elif status == cp_model.INFEASIBLE:
+        return _infeasible_result()
 
     else:
         return {
@@ -163,6 +271,88 @@ def solve_driver_assignment(data):
         }
 
 
+def _build_result(drivers, routes, pairs, objective_value):
+    """
+    Build the optimal-solution response from the chosen driver/route pairs.
+
+    Args:
+        drivers (list): List of driver dictionaries
+        routes (list): List of route dictionaries
+        pairs (iterable): (driver index, route index) tuples that were assigned
+        objective_value (float): Objective value of the solution
+
+    Returns:
+        dict: Assignment results with route-driver mapping for the day
+    """
+    assignments = []
+    unassigned_routes = []
+
+    # Initialize driver assignments, indexed like drivers
+    driver_assignments = [{
+        'name': driver['name'],
+        'assigned_route': None,
+        'assigned_hours': 0,
+        'remaining_hours': driver['available_hours']
+    } for driver in drivers]
+
+    # Process assignments
+    total_assigned_hours = 0
+    for i, j in pairs:
+        assignment = {
+            'driver_name': drivers[i]['name'],
+            'route_name': routes[j]['name'],
+            'route_hours': routes[j]['hours']
+        }
+        assignments.append(assignment)
+
+        # Update driver assignment info
+        driver_assignments[i]['assigned_route'] = routes[j]['name']
+        driver_assignments[i]['assigned_hours'] = routes[j]['hours']
+        driver_assignments[i]['remaining_hours'] = (
+            drivers[i]['available_hours'] - routes[j]['hours'])
+        total_assigned_hours += routes[j]['hours']
+
+    # Find unassigned routes
+    assigned_routes = {assignment['route_name'] for assignment in assignments}
+    for route in routes:
+        if route['name'] not in assigned_routes:
+            unassigned_routes.append(route['name'])
+
+    return {
+        'status': 'optimal',
+        'assignments': assignments,
+        'driver_status': driver_assignments,
+        'unassigned_routes': unassigned_routes,
+        'statistics': {
+            'total_routes': len(routes),
+            'routes_assigned': len(assignments),
+            'routes_unassigned': len(unassigned_routes),
+            'total_hours_assigned': total_assigned_hours,
+            'drivers_working': len(assignments),
+            'drivers_available': len(drivers)
+        },
+        'objective_value': objective_value
+    }
+
+
+def _infeasible_result():
+    """
+    Build the response returned when no feasible assignment exists.
+
+    Returns:
+        dict: Infeasible status with possible reasons
+    """
+    return {
+        'status':
+        'infeasible',
+        'message':
+        'No feasible solution found. Possible reasons:\n'
+        '1. Total route hours exceed total available driver hours\n'
+        '2. Individual driver remaining hours are insufficient\n'
+        '3. More routes than available drivers'
+    }
+
+
 def validate_assignment_input(data):
     """
     Validate the input data for driver assignment.
@@ -191,33 +381,47 @@ def validate_assignment_input(data):
     if len(routes) == 0:
         return False, "At least one route is required"
 
-    # Validate driver structure
+    number_types = (int, float)
+
+    # Validate driver structure, tracking the most hours any driver has left
+    max_driver_hours = -1
     for i, driver in enumerate(drivers):
         if not isinstance(driver, dict):
             return False, f"Driver {i} must be an object"
 
-        if 'name' not in driver or 'available_hours' not in driver:
+        # Both fields must be present; only the hours are needed here
+        try:
+            driver['name']
+            hours = driver['available_hours']
+        except KeyError:
             return False, f"Driver {i} must have 'name' and 'available_hours' fields"
 
-        if not isinstance(driver['available_hours'],
-                          (int, float)) or driver['available_hours'] < 0:
+        if not isinstance(hours, number_types) or hours < 0:
             return False, f"Driver {i} 'available_hours' must be a non-negative number"
 
-    # Validate route structure
+        if hours > max_driver_hours:
+            max_driver_hours = hours
+
+    # Validate route structure, tracking the shortest route
+    min_route_hours = float('inf')
     for i, route in enumerate(routes):
         if not isinstance(route, dict):
             return False, f"Route {i} must be an object"
 
-        if 'name' not in route or 'hours' not in route:
+        # Both fields must be present; only the hours are needed here
+        try:
+            route['name']
+            hours = route['hours']
+        except KeyError:
             return False, f"Route {i} must have 'name' and 'hours' fields"
 
-        if not isinstance(route['hours'], (int, float)) or route['hours'] < 0:
+        if not isinstance(hours, number_types) or hours < 0:
             return False, f"Route {i} 'hours' must be a non-negative number"
 
-    # Check if any driver can handle any route
-    max_driver_hours = max(driver['available_hours'] for driver in drivers)
-    min_route_hours = min(route['hours'] for route in routes)
+        if hours < min_route_hours:
+            min_route_hours = hours
 
+    # Check if any driver can handle any route
     if max_driver_hours < min_route_hours:
         return False, f"No driver has enough hours ({max_driver_hours}) to handle the shortest route ({min_route_hours})"
 
@@ -237,77 +441,191 @@ def update_driver_hours(drivers, assignments):
     Returns:
         list: Updated drivers list with reduced available hours
     """
-    updated_drivers = []
-
     # Create a mapping of driver names to assigned hours
-    assignment_map = {}
-    for assignment in assignments:
-        assignment_map[assignment['driver_name']] = assignment['route_hours']
+    assignment_map = {
+        assignment['driver_name']: assignment['route_hours']
+        for assignment in assignments
+    }
+
+    # Copy each driver with its available hours reduced
+    return [{
+        **driver,
+        'available_hours':
+        max(0, driver['available_hours'] - assignment_map.get(driver['name'], 0))
+    } for driver in drivers]
+
+
+def _json_loads(data):
+    """
+    Parse JSON from bytes or str, using orjson when it is installed.
+
+    Args:
+        data (bytes or str): JSON document
+
+    Returns:
+        The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-    # Update each driver's available hours
-    for driver in drivers:
-        updated_driver = driver.copy()
-        assigned_hours = assignment_map.get(driver['name'], 0)
-        updated_driver['available_hours'] = max(
-            0, driver['available_hours'] - assigned_hours)
-        updated_drivers.append(updated_driver)
+def _write_json(obj):
+    """
+    Write an object to stdout as a single line of JSON, using orjson when it
+    is installed.
+
+    The object is fully encoded before anything is written, so an encoding
+    error leaves no partial line on stdout.
+
+    Args:
+        obj: JSON-serializable object
+
+    Raises:
+        TypeError: If the object can't be encoded as JSON
+        ValueError: If the object can't be encoded as JSON
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(obj)
+    else:
+        # NaN and Infinity aren't valid JSON, so they're refused rather than
+        # written out for the Node side to choke on
+        encoded = json.dumps(obj, separators=(',', ':'),
+                             allow_nan=False).encode()
+    sys.stdout.buffer.write(encoded + b'\n')
+    sys.stdout.buffer.flush()
+
+
+def handle_request(request):
+    """
+    Handle a single request received in service mode.
+
+    Args:
+        request (dict): Contains the 'operation' name and its 'input'. For
+            'square' the input may be a single number or a list of numbers.
+            For 'solve_assignment' a truthy 'use_mip' field in the input
+            selects the CP-SAT integer program.
+
+    Returns:
+        dict: Operation result, or an 'error' field describing the failure
+    """
+    operation = request.get('operation')
+    input_data = request.get('input')
+
+    if operation == "square":
+        try:
+            # A list of numbers is squared in one vectorized operation. Each
+            # item goes through float() like a single number does, so null or
+            # nested items are rejected rather than turned into NaN
+            if isinstance(input_data, list):
+                numbers = np.fromiter((float(number) for number in input_data),
+                                      dtype=np.float64,
+                                      count=len(input_data))
+                with np.errstate(over='raise'):
+                    return {"result": (numbers * numbers).tolist()}
+            return {"result": square_number(float(input_data))}
+        except (TypeError, ValueError, OverflowError, FloatingPointError):
+            return {"error": "Invalid number"}
 
-    return updated_drivers
+    elif operation == "solve_assignment":
+        is_valid, error_msg = validate_assignment_input(input_data)
+        if not is_valid:
+            return {"error": error_msg}
+        try:
+            return solve_driver_assignment(input_data)
+        except Exception as e:
+            return {"error": str(e)}
+
+    elif operation == "validate":
+        is_valid, error_msg = validate_assignment_input(input_data)
+        return {"valid": is_valid, "message": error_msg}
+
+    else:
+        return {"error": f"Unknown operation '{operation}'"}
+
+
+def serve():
+    """
+    Run as a long-running service, reading one JSON request per line from stdin
+    and writing one JSON response per line to stdout. This keeps the Python
+    interpreter and solver warm between requests.
+    """
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        # ValueError covers malformed JSON from either parser as well as
+        # bytes that aren't valid UTF-8. The standard library parser raises
+        # RecursionError instead for input that is nested too deeply
+        try:
+            response = handle_request(_json_loads(line))
+        except (ValueError, RecursionError, AttributeError):
+            response = {"error": "Invalid JSON input"}
+        except Exception as e:
+            # One bad request must not take down the requests queued behind it
+            response = {"error": str(e)}
+
+        # Every request must get exactly one response line, even if its
+        # result can't be encoded
+        try:
+            _write_json(response)
+        except (TypeError, ValueError) as e:
+            _write_json({"error": f"Failed to encode response: {e}"})
 
 
 def main():
     """
     Main function to handle command-line interface for OR-Tools operations.
     """
-    import sys
-
     if len(sys.argv) < 2:
         print("Error: Operation not specified")
         sys.exit(1)
 
     operation = sys.argv[1]
 
-    if operation == "square":
+    if operation == "serve":
+        serve()
+
+    elif operation == "square":
         if len(sys.argv) < 3:
             print("Error: Number not specified")
             sys.exit(1)
         try:
             number = float(sys.argv[2])
             result = square_number(number)
-            print(json.dumps({"result": result}))
-        except ValueError:
+            _write_json({"result": result})
+        except (ValueError, OverflowError):
             print("Error: Invalid number")
             sys.exit(1)
 
     elif operation == "solve_assignment":
         # Read JSON from stdin
-        input_data = sys.stdin.read()
+        input_data = sys.stdin.buffer.read()
         try:
-            data = json.loads(input_data)
+            data = _json_loads(input_data)
             
             # Validate input
             is_valid, error_msg = validate_assignment_input(data)
             if not is_valid:
-                print(json.dumps({"status": "error", "message": error_msg}))
+                _write_json({"status": "error", "message": error_msg})
                 sys.exit(1)
             
             result = solve_driver_assignment(data)
-            print(json.dumps(result))
-        except json.JSONDecodeError:
+            _write_json(result)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             print("Error: Invalid JSON input")
             sys.exit(1)
         except Exception as e:
-            print(json.dumps({"status": "error", "message": str(e)}))
+            _write_json({"status": "error", "message": str(e)})
             sys.exit(1)
 
     elif operation == "validate":
         # Read JSON from stdin
-        input_data = sys.stdin.read()
+        input_data = sys.stdin.buffer.read()
         try:
-            data = json.loads(input_data)
+            data = _json_loads(input_data)
             is_valid, error_msg = validate_assignment_input(data)
-            print(json.dumps({"valid": is_valid, "message": error_msg}))
-        except json.JSONDecodeError:
+            _write_json({"valid": is_valid, "message": error_msg})
+        except (json.JSONDecodeError, UnicodeDecodeError):
             print("Error: Invalid JSON input")
             sys.exit(1)
 
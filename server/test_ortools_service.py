@@ -0,0 +1,55 @@
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The service file name has a hyphen, so it is loaded from its path
+_SPEC = importlib.util.spec_from_file_location(
+    'ortools_service',
+    Path(__file__).with_name('ortools-service.py'))
+service = importlib.util.module_from_spec(_SPEC)
+sys.modules[_SPEC.name] = service
+_SPEC.loader.exec_module(service)
+
+
+def _random_case(rng):
+    """
+    Generate a random assignment problem, occasionally with more routes than
+    drivers so infeasible inputs are covered too.
+    """
+    drivers = [{
+        'name': f'Driver {i}',
+        'available_hours': rng.choice([0, 4, 8, 8, 10, 12, rng.randint(0, 40)])
+    } for i in range(rng.randint(1, 10))]
+    routes = [{
+        'name': f'Route {j}',
+        'hours': rng.choice([4, 8, 8, 10, rng.randint(0, 20)])
+    } for j in range(rng.randint(1, len(drivers) + 1))]
+    return drivers, routes
+
+
+@pytest.mark.parametrize('case', range(100))
+def test_solvers_agree(case):
+    """
+    The default path (sorting, then the assignment solver), the assignment
+    solver on its own and the CP-SAT integer program must report the same
+    status and, when optimal, the same objective value.
+    """
+    drivers, routes = _random_case(random.Random(case))
+    driver_hours, route_hours, weights = service._pack_hours(drivers, routes)
+    feasible = service._feasible_pairs(driver_hours, route_hours)
+    data = {'drivers': drivers, 'routes': routes}
+
+    results = [
+        service.solve_driver_assignment(data),
+        service.solve_driver_assignment(data, use_mip=True),
+        service._solve_with_assignment(drivers, routes, feasible, weights),
+        service._solve_with_cp_sat(drivers, routes, feasible, weights),
+    ]
+
+    assert len({result['status'] for result in results}) == 1
+    if results[0]['status'] == 'optimal':
+        objectives = [result['objective_value'] for result in results]
+        assert max(objectives) - min(objectives) <= 1e-6